@@ -1,15 +1,23 @@
 import os
+import asyncio
+import threading
+from http.cookiejar import LWPCookieJar
 import re
-import json
+import codecs
+import hashlib
+import orjson
 import logging
-import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from dotenv import load_dotenv
 from telegram import Update
 from telegram.constants import ParseMode
 from telegram.ext import Application, CommandHandler, ContextTypes
 import datetime
 import zoneinfo
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
 
 # --- Basic Logging & Configuration ---
 logging.basicConfig(
@@ -19,65 +27,131 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 STATE_FILE = "transfers.json"
+COOKIE_FILE = "fix_cookies.txt"
+# In-memory mirror of STATE_FILE; this process is its only writer, so it never goes stale
+_STATE_CACHE: dict | None = None
+
+# Shared session reused by every check so the TCP/TLS connection and login cookies survive
+_SESSION: "requests.Session | None" = None
+# Validators and parsed result of the last successful scrape, for conditional GETs of TARGET_URL
+_REVEAL_CACHE = {"etag": None, "last_modified": None, "result": None}
+# Serialises checks: /check and the daily job run in worker threads but share the session and state file
+_CHECK_LOCK = threading.Lock()
 
-# --- Constants & Schedule Config (unchanged) ---
+# --- Constants & Schedule Config ---
 FIX_LOGIN_URL = "https://www.fantasyfootballfix.com/signin/"
 FIX_ORIGIN = "https://www.fantasyfootballfix.com"
 TARGET_URL = "https://www.fantasyfootballfix.com/reveal/"
+# (connect, read) seconds; without it a stalled connection would hang the check and hold _CHECK_LOCK forever
+REQUEST_TIMEOUT = (10, 30)
+_BASE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36",
+    "Accept-Encoding": "gzip, br",
+    "Connection": "keep-alive",
+}
 TIMEZONE = zoneinfo.ZoneInfo("Asia/Singapore")
 REPORT_TIME = datetime.time(hour=9, minute=15, second=0, tzinfo=TIMEZONE)
 
-# --- Helper Functions (unchanged) ---
+# --- Precompiled patterns for the reveal page (run against the #team2 div) ---
+_GW_RE = re.compile(r'Gameweek (\d+)')
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_XP_GW = etree.XPath('.//h3[contains(text(),"Gameweek")]/text()')
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching a whole class token, like bs4's class_= (contains(@class, ...) alone also hits 'name-suffix')."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+_XP_CHIP = etree.XPath(f'(.//li[{_has_class("rchip--active")}])[1]//span[{_has_class("rchip__chip")}]')
+_XP_ROWS = etree.XPath(f'(.//ul[{_has_class("rtransfers__ul")}])[1]//li[{_has_class("rtransfers__transfer")}]')
+_XP_PLAYERS = etree.XPath(f'.//div[{_has_class("rtransfers__player")}]')
+_XP_NAME = etree.XPath(f'.//p[{_has_class("rtransfers__name")}]')
+
+def _element_text(element) -> str:
+    """All descendant text of an element, stripped (the equivalent of bs4's .text.strip())."""
+    return ''.join(element.itertext()).strip()
+
+# --- Helper Functions ---
+_MD_TABLE = str.maketrans({char: '\\' + char for char in r'_*[]()~`>#+-=|{}.!'})
+
 def escape_markdown(text: str) -> str:
-    escape_chars = r'_*[]()~`>#+-=|{}.!'
-    return ''.join(f'\\{char}' if char in escape_chars else char for char in text)
+    return text.translate(_MD_TABLE)
+
+def _format_transfer_message(header: str, chip: str | None, transfers: list, intro: str | None = None) -> str:
+    """Builds the MarkdownV2 report: header, active chip, optional intro line, then one OUT/IN block per transfer."""
+    # Escape the chip and every player name in a single pass over a NUL-joined string, then split back apart
+    raw = [chip or 'None']
+    for p_out, p_in in transfers:
+        raw += (p_out, p_in)
+    escaped = escape_markdown("\0".join(raw)).split("\0")
+    message = [header, f"Chip Active: *{escaped[0]}*\n"]
+    if intro:
+        message.append(intro)
+    message.extend(f"🔴 OUT: `{p_out}`\n🟢 IN: `{p_in}`\n" for p_out, p_in in zip(escaped[1::2], escaped[2::2]))
+    return "\n".join(message)
 
 # --- UPDATED: Helper functions for the gameweek-aware state file ---
 def load_state() -> dict:
+    """Returns the state (gameweek and transfers), reading the JSON file only on first use."""
+    global _STATE_CACHE
+    if _STATE_CACHE is None:
+        _STATE_CACHE = _read_state_file()
+    return _STATE_CACHE
+
+def _read_state_file() -> dict:
     """Loads the state (gameweek and transfers) from the JSON file."""
     try:
-        with open(STATE_FILE, 'r') as f:
-            data = json.load(f)
+        with open(STATE_FILE, 'rb') as f:
+            data = orjson.loads(f.read())
             # Basic validation for the new structure
             if isinstance(data, dict) and 'gameweek' in data and 'transfers' in data:
                 return data
             # If the file has the old list format, reset it
             logger.warning("Old state file format detected. Starting fresh.")
             return {"gameweek": None, "transfers": []}
-    except (FileNotFoundError, json.JSONDecodeError):
+    except (FileNotFoundError, orjson.JSONDecodeError):
         return {"gameweek": None, "transfers": []}
 
-def save_state(gameweek: int, transfers: list) -> None:
-    """Saves the current state to the JSON file."""
-    state = {"gameweek": gameweek, "transfers": transfers}
-    with open(STATE_FILE, 'w') as f:
-        json.dump(state, f, indent=2)
+def _transfers_fingerprint(transfers: list) -> str:
+    """Order-independent digest of a transfer list, stable across restarts (unlike hash())."""
+    return hashlib.blake2b(orjson.dumps(sorted(transfers)), digest_size=8).hexdigest()
+
+def save_state(gameweek: int, transfers: list, fingerprint: str | None = None) -> None:
+    """Saves the current state to the JSON file, atomically so a crash mid-write keeps the old file."""
+    global _STATE_CACHE
+    if fingerprint is None:
+        fingerprint = _transfers_fingerprint(transfers)
+    state = {"gameweek": gameweek, "transfers": transfers, "fingerprint": fingerprint}
+    tmp_file = STATE_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, STATE_FILE)
+    _STATE_CACHE = state
 
-# --- FPL Scraping Logic (unchanged) ---
-# The login_to_fix and scrape_target_transfers functions are the same as before.
-# I've omitted them here for brevity, but they should remain in your script.
+# --- FPL Scraping Logic ---
 def login_to_fix(session, email, password):
-    # (This function remains the same as before)
+    # requests and bs4 are imported inside the scraping functions to keep bot startup fast
+    import requests
+    from bs4 import BeautifulSoup
     logger.info("Attempting to log in to Fantasy Football Fix...")
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36", "Referer": FIX_LOGIN_URL}
+    headers = {"Referer": FIX_LOGIN_URL}
     try:
-        res = session.get(FIX_LOGIN_URL, headers=headers)
+        res = session.get(FIX_LOGIN_URL, headers=headers, timeout=REQUEST_TIMEOUT)
         res.raise_for_status()
-        soup = BeautifulSoup(res.text, 'html.parser')
+        soup = BeautifulSoup(res.content, 'lxml')
         csrf_token_form = soup.find('input', {'name': 'csrfmiddlewaretoken'})['value']
         csrf_token_cookie = session.cookies.get('csrftoken')
         email_headers = headers.copy()
-        email_headers.update({'Origin': FIX_ORIGIN,'Content-Type': 'application/x-www-form-urlencoded','X-CSRFToken': csrf_token_cookie})
+        email_headers.update({'Origin': FIX_ORIGIN,'X-CSRFToken': csrf_token_cookie})
         email_payload = {"email": email, "csrfmiddlewaretoken": csrf_token_form}
-        res_email = session.post(FIX_LOGIN_URL, data=email_payload, headers=email_headers)
+        res_email = session.post(FIX_LOGIN_URL, data=email_payload, headers=email_headers, timeout=REQUEST_TIMEOUT)
         res_email.raise_for_status()
-        soup_pass = BeautifulSoup(res_email.text, 'html.parser')
+        soup_pass = BeautifulSoup(res_email.content, 'lxml')
         if not soup_pass.find('input', {'type': 'password'}):
             logger.error("Failed at email submission step. No password field found.")
             return False
         csrf_token_pass = soup_pass.find('input', {'name': 'csrfmiddlewaretoken'})['value']
         password_payload = {"password": password,"csrfmiddlewaretoken": csrf_token_pass,"email": email}
-        res_pass = session.post(FIX_LOGIN_URL, data=password_payload, headers=email_headers)
+        res_pass = session.post(FIX_LOGIN_URL, data=password_payload, headers=email_headers, timeout=REQUEST_TIMEOUT)
         res_pass.raise_for_status()
         if "Logout" in res_pass.text or "My Account" in res_pass.text:
             logger.info("Fantasy Football Fix login successful!")
@@ -89,42 +163,105 @@ def login_to_fix(session, email, password):
         logger.error(f"An error occurred during login: {e}")
         return False
 
+class _DivTarget:
+    """lxml parser target that builds a tree for a single <div id=...> and ignores the rest of the page."""
+    def __init__(self, div_id):
+        self.div_id = div_id
+        self.builder = None
+        self.depth = 0
+        self.done = False
+
+    def start(self, tag, attrib):
+        if self.done:
+            return
+        if self.builder is None:
+            if tag != 'div' or attrib.get('id') != self.div_id:
+                return
+            self.builder = etree.TreeBuilder()
+        self.depth += 1
+        self.builder.start(tag, dict(attrib))
+
+    def end(self, tag):
+        if self.builder is None or self.done:
+            return
+        self.builder.end(tag)
+        self.depth -= 1
+        if self.depth == 0:
+            self.done = True
+
+    def data(self, data):
+        if self.builder is not None and not self.done:
+            self.builder.data(data)
+
+    def close(self):
+        return self.builder.close() if self.done else None
+
+def _html_parser(target, content_type):
+    """
+    Builds an HTMLParser that honours the charset from the Content-Type header, like response.text did.
+    Without one (or with one libxml2 doesn't know) lxml falls back to sniffing <meta> tags.
+    """
+    match = _CHARSET_RE.search(content_type)
+    if match:
+        try:
+            return etree.HTMLParser(target=target, encoding=codecs.lookup(match.group(1)).name)
+        except LookupError:
+            logger.warning(f"Unsupported charset {match.group(1)!r} in Content-Type. Letting lxml detect it.")
+    return etree.HTMLParser(target=target)
+
+def _parse_div_by_id(response, div_id):
+    """Incrementally parses a streamed response, stopping as soon as the wanted div has closed."""
+    target = _DivTarget(div_id)
+    parser = _html_parser(target, response.headers.get("Content-Type", ""))
+    for chunk in response.iter_content(8192):
+        parser.feed(chunk)
+        if target.done:
+            break
+    return parser.close()
+
 def scrape_target_transfers(session):
-    # (This function remains the same as before)
+    import requests
     target_div_id = "team2"
     logger.info(f"Scraping transfers for manager from {TARGET_URL}")
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"}
+    headers = {}
+    if _REVEAL_CACHE["result"] is not None:
+        if _REVEAL_CACHE["etag"]:
+            headers["If-None-Match"] = _REVEAL_CACHE["etag"]
+        if _REVEAL_CACHE["last_modified"]:
+            headers["If-Modified-Since"] = _REVEAL_CACHE["last_modified"]
     try:
-        response = session.get(TARGET_URL, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        manager_section = soup.find('div', id=target_div_id)
-        if not manager_section:
+        with session.get(TARGET_URL, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if response.status_code == 304 and _REVEAL_CACHE["result"] is not None:
+                logger.info("Target page not modified since the last scrape. Reusing cached result.")
+                return _REVEAL_CACHE["result"]
+            response.raise_for_status()
+            manager_section = _parse_div_by_id(response, target_div_id)
+            etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if manager_section is None:
             logger.warning("Could not find the target manager's section on the page.")
             return [], None, None
         gameweek, active_chip, scraped_transfers = None, None, []
-        gameweek_header = manager_section.find('h3', string=re.compile(r"Gameweek \d+"))
-        if gameweek_header:
-            match = re.search(r'Gameweek (\d+)', gameweek_header.text)
-            if match: gameweek = match.group(1)
-        active_chip_li = manager_section.find('li', class_='rchip--active')
-        if active_chip_li:
-            active_chip_span = active_chip_li.find('span', class_='rchip__chip')
-            if active_chip_span: active_chip = active_chip_span.text.strip()
-        transfers_ul = manager_section.find('ul', class_='rtransfers__ul')
-        if transfers_ul:
-            transfer_items = transfers_ul.find_all('li', class_='rtransfers__transfer')
-            for item in transfer_items:
-                player_divs = item.find_all('div', class_='rtransfers__player')
-                if len(player_divs) == 2:
-                    player_out_tag = player_divs[0].find('p', class_='rtransfers__name')
-                    player_in_tag = player_divs[1].find('p', class_='rtransfers__name')
-                    if player_out_tag and player_in_tag:
-                        p_out = player_out_tag.text.strip()
-                        p_in = player_in_tag.text.strip()
-                        if "Default Player" not in p_out and "Default Player" not in p_in:
-                             scraped_transfers.append([p_out, p_in]) # Use list for JSON
-        return scraped_transfers, active_chip, gameweek
+        for header_text in _XP_GW(manager_section):
+            match = _GW_RE.search(header_text)
+            if match:
+                gameweek = match.group(1)
+                break
+        active_chip_span = _XP_CHIP(manager_section)
+        if active_chip_span: active_chip = _element_text(active_chip_span[0])
+        for item in _XP_ROWS(manager_section):
+            player_divs = _XP_PLAYERS(item)
+            if len(player_divs) == 2:
+                player_out_tag = _XP_NAME(player_divs[0])
+                player_in_tag = _XP_NAME(player_divs[1])
+                if player_out_tag and player_in_tag:
+                    p_out = _element_text(player_out_tag[0])
+                    p_in = _element_text(player_in_tag[0])
+                    if "Default Player" not in p_out and "Default Player" not in p_in:
+                        scraped_transfers.append([p_out, p_in]) # Use list for JSON
+        result = (scraped_transfers, active_chip, gameweek)
+        if gameweek is not None:
+            _REVEAL_CACHE.update(etag=etag, last_modified=last_modified, result=result)
+        return result
     except requests.exceptions.RequestException as e:
         logger.error(f"Error requesting target page: {e}")
         return [], None, None
@@ -133,74 +270,135 @@ def scrape_target_transfers(session):
         return [], None, None
 
 
+# --- Persistent HTTP session (kept alive across checks) ---
+def _load_cookies(session) -> bool:
+    """Copies cookies saved by a previous run into the session. Returns True if any were loaded."""
+    jar = LWPCookieJar(COOKIE_FILE)
+    try:
+        jar.load(ignore_discard=True)
+    except OSError:
+        return False
+    session.cookies.update(jar)
+    return len(jar) > 0
+
+def _save_cookies(session) -> None:
+    """Persists the session's cookies so the next run can skip the login flow."""
+    jar = LWPCookieJar(COOKIE_FILE)
+    for cookie in session.cookies:
+        jar.set_cookie(cookie)
+    try:
+        jar.save(ignore_discard=True)
+    except OSError as e:
+        logger.warning(f"Could not save session cookies: {e}")
+
+def _get_session(email, password, use_saved_cookies=True):
+    """
+    Returns the shared session, creating it on first use.
+    A new session reuses cookies saved by a previous run when available and only logs in otherwise.
+    Returns:
+        (requests.Session | None): The session, or None if login failed.
+        (bool): True if this call performed a fresh login.
+    """
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION, False
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    s = requests.Session()
+    s.headers.update(_BASE_HEADERS)
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], allowed_methods=frozenset(["GET", "POST"]))
+    s.mount("https://", HTTPAdapter(max_retries=retry, pool_connections=2, pool_maxsize=4))
+    if use_saved_cookies and _load_cookies(s):
+        logger.info("Reusing saved Fantasy Football Fix session cookies.")
+        _SESSION = s
+        return _SESSION, False
+    if not login_to_fix(s, email, password):
+        s.close()
+        return None, False
+    _save_cookies(s)
+    _SESSION = s
+    return _SESSION, True
+
+def _reset_session() -> None:
+    """Drops the shared session so the next check logs in from scratch."""
+    global _SESSION
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
+
 # --- REWRITTEN: Main logic now handles gameweek changes ---
 def check_for_new_transfers(fix_email: str, fix_password: str) -> tuple[str, bool]:
     """
     Checks for new transfers, accounting for gameweek changes.
+    Blocking; handlers run it via asyncio.to_thread to keep the event loop free.
     Returns:
         (str): The message to be sent.
         (bool): True if a noteworthy update (new transfers) occurred.
     """
-    with requests.Session() as s:
-        if not login_to_fix(s, fix_email, fix_password):
-            return "❌ *Login Failed*\nCould not log in to Fantasy Football Fix\.", False
+    with _CHECK_LOCK:
+        return _check_for_new_transfers(fix_email, fix_password)
 
+def _check_for_new_transfers(fix_email: str, fix_password: str) -> tuple[str, bool]:
+    s, logged_in = _get_session(fix_email, fix_password)
+    if s is None:
+        return "❌ *Login Failed*\nCould not log in to Fantasy Football Fix\.", False
+
+    # The scrape doubles as a probe: a reused session or saved cookies may have expired
+    # server-side, in which case we log in again and retry once.
+    current_transfers, chip, current_gameweek_str = scrape_target_transfers(s)
+    if current_gameweek_str is None and not logged_in:
+        logger.info("Scrape failed on a reused session. Logging in again and retrying.")
+        _reset_session()
+        s, _ = _get_session(fix_email, fix_password, use_saved_cookies=False)
+        if s is None:
+            return "❌ *Login Failed*\nCould not log in to Fantasy Football Fix\.", False
         current_transfers, chip, current_gameweek_str = scrape_target_transfers(s)
-        if current_gameweek_str is None:
-            return "⚠️ *Scraping Error*\nCould not find the current gameweek\.", False
+    if current_gameweek_str is None:
+        return "⚠️ *Scraping Error*\nCould not find the current gameweek\.", False
+    
+    current_gameweek = int(current_gameweek_str)
+    saved_state = load_state()
+    saved_gameweek = saved_state.get('gameweek')
+    saved_transfers = saved_state.get('transfers', [])
+
+    # Case 1: Gameweek has changed
+    if current_gameweek != saved_gameweek:
+        logger.info(f"Gameweek changed from {saved_gameweek} to {current_gameweek}. Resetting transfers.")
+        save_state(current_gameweek, current_transfers)
         
-        current_gameweek = int(current_gameweek_str)
-        saved_state = load_state()
-        saved_gameweek = saved_state.get('gameweek')
-        saved_transfers = saved_state.get('transfers', [])
-
-        # Case 1: Gameweek has changed
-        if current_gameweek != saved_gameweek:
-            logger.info(f"Gameweek changed from {saved_gameweek} to {current_gameweek}. Resetting transfers.")
-            save_state(current_gameweek, current_transfers)
-            
-            if not current_transfers:
-                return f" Gameweek has updated to *GW {current_gameweek}*\. No transfers made yet\.", False
-            else:
-                message = [f"🚀 *First Transfers for GW {current_gameweek} Detected* 🚀\n"]
-                escaped_chip = escape_markdown(chip or 'None')
-                message.append(f"Chip Active: *{escaped_chip}*\n")
-                for p_out, p_in in current_transfers:
-                    message.append(f"🔴 OUT: `{escape_markdown(p_out)}`")
-                    message.append(f"🟢 IN: `{escape_markdown(p_in)}`\n")
-                return "\n".join(message), True
-
-        # Case 2: Same gameweek, check for new transfers
+        if not current_transfers:
+            return f" Gameweek has updated to *GW {current_gameweek}*\. No transfers made yet\.", False
+        else:
+            header = f"🚀 *First Transfers for GW {current_gameweek} Detected* 🚀\n"
+            return _format_transfer_message(header, chip, current_transfers), True
+
+    # Case 2: Same gameweek, check for new transfers
+    else:
+        # Cheap fingerprint comparison first; only diff the lists when the scrape differs from the saved one
+        current_fingerprint = _transfers_fingerprint(current_transfers)
+        if current_fingerprint == saved_state.get('fingerprint'):
+            new_transfers = []
         else:
             seen_set = {tuple(t) for t in saved_transfers}
-            current_set = {tuple(t) for t in current_transfers}
-            new_transfers = current_set - seen_set
-
-            if not new_transfers:
-                logger.info(f"No new transfers found for GW {current_gameweek}.")
-                return f"✅ *No new transfers for GW {current_gameweek}* since the last check\.", False
-            
-            logger.info(f"Found {len(new_transfers)} new transfer(s) for GW {current_gameweek}.")
-            save_state(current_gameweek, current_transfers)
-
-            message = [f"🚨 *New Transfers Detected for GW {current_gameweek}* 🚨\n"]
-            escaped_chip = escape_markdown(chip or 'None')
-            message.append(f"Chip Active: *{escaped_chip}*\n")
-            message.append("*New Transfers:*\n")
-            for p_out, p_in in new_transfers:
-                message.append(f"🔴 OUT: `{escape_markdown(p_out)}`")
-                message.append(f"🟢 IN: `{escape_markdown(p_in)}`\n")
-            
-            return "\n".join(message), True
-
-# --- Telegram Bot Logic (unchanged) ---
-# The send_daily_report, check, start, and main functions are the same as before.
-# They will work correctly with the new logic in check_for_new_transfers.
+            new_transfers = [t for t in current_transfers if tuple(t) not in seen_set]
+
+        if not new_transfers:
+            logger.info(f"No new transfers found for GW {current_gameweek}.")
+            return f"✅ *No new transfers for GW {current_gameweek}* since the last check\.", False
+        
+        logger.info(f"Found {len(new_transfers)} new transfer(s) for GW {current_gameweek}.")
+        save_state(current_gameweek, current_transfers, current_fingerprint)
+
+        header = f"🚨 *New Transfers Detected for GW {current_gameweek}* 🚨\n"
+        return _format_transfer_message(header, chip, new_transfers, intro="*New Transfers:*\n"), True
+
+# --- Telegram Bot Logic ---
 async def send_daily_report(context: ContextTypes.DEFAULT_TYPE) -> None:
     logger.info("Running scheduled daily report job...")
     fix_email = os.getenv("FIX_EMAIL")
     fix_password = os.getenv("FIX_PASSWORD")
-    message, has_updates = check_for_new_transfers(fix_email, fix_password)
+    message, has_updates = await asyncio.to_thread(check_for_new_transfers, fix_email, fix_password)
     if has_updates:
         await context.bot.send_message(chat_id=context.job.chat_id, text=message, parse_mode=ParseMode.MARKDOWN_V2)
     else:
@@ -211,7 +409,7 @@ async def check(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     await update.message.reply_text("🔎 Checking for new transfers...")
     fix_email = os.getenv("FIX_EMAIL")
     fix_password = os.getenv("FIX_PASSWORD")
-    result_message, _ = check_for_new_transfers(fix_email, fix_password)
+    result_message, _ = await asyncio.to_thread(check_for_new_transfers, fix_email, fix_password)
     await update.message.reply_text(result_message, parse_mode=ParseMode.MARKDOWN_V2)
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None: